@@ -1,6 +1,12 @@
 import fbx
 
 
+# --------------------------------------------------------------------------
+# -- Zero vector used when zeroing transforms. Property.Set copies the value
+# -- so this is safe to share, but it must never be altered.
+_ZERO3 = fbx.FbxDouble3(0.0, 0.0, 0.0)
+
+
 # --------------------------------------------------------------------------
 def layers(fbx_scene):
     """
@@ -10,30 +16,23 @@ def layers(fbx_scene):
     :type fbx_scene: fbx.FbxScene
     :return: list(fbx.FbxAnimLayer, ...)
     """
-    # -- Define a list to collate our matched
-    # -- layers into
-    all_layers = list()
+    # -- Build the criteria once for this call. Note that this cannot be
+    # -- done at import time, as the class id is only valid once the
+    # -- manager which owns the scene has registered its classes
+    criteria = fbx.FbxCriteria.ObjectType(fbx.FbxAnimLayer.ClassId)
 
-    # -- Cycle over all the obects in the scnee
-    for idx in range(fbx_scene.GetSrcObjectCount()):
+    # -- Restrict the count to animation layers only, so the sdk
+    # -- skips over every other object in the scene for us
+    layer_count = fbx_scene.GetSrcObjectCount(criteria)
 
-        # -- Check if this item is indeed an animation
-        # -- layer and scoop it if it is.
-        candidate = fbx_scene.GetSrcObject(
-            fbx.FbxCriteria.ObjectType(
-                fbx.FbxAnimLayer.ClassId,
-            ),
-            idx,
-        )
-
-        if candidate:
-            all_layers.append(candidate)
-
-    return all_layers
+    return [
+        fbx_scene.GetSrcObject(criteria, idx)
+        for idx in range(layer_count)
+    ]
 
 
 # --------------------------------------------------------------------------
-def remove_tr_keys(node, zero=False):
+def remove_tr_keys(node, zero=False, layers_list=None):
     """
     This removes any keys (fcurves) driving the translation or rotation
     of the given node.
@@ -41,12 +40,41 @@ def remove_tr_keys(node, zero=False):
     :param node: The node to remove the translation and rotation from
     :type node: fbx.FbxNode
 
+    :param zero: If True the translation and rotation will also be zeroed
+    :type zero: bool
+
+    :param layers_list: Optional list of the animation layers in the scene.
+        When operating on many nodes this can be resolved once and passed
+        in to avoid re-querying the scene for each node.
+    :type layers_list: list(fbx.FbxAnimLayer, ...)
+
     :return: None
     """
-    for layer in layers(node.GetScene()):
+    # -- Resolve the properties once rather than per layer
+    rotation = node.LclRotation
+    translation = node.LclTranslation
+
+    # -- Static nodes have nothing to remove, so we only look through
+    # -- the layers if either property has a curve node connected. We
+    # -- count the connections directly rather than using IsAnimated, as
+    # -- that only considers the first layer of the current stack. The
+    # -- criteria is built here as the class id is only valid once a
+    # -- manager has registered its classes
+    curve_criteria = fbx.FbxCriteria.ObjectType(fbx.FbxAnimCurveNode.ClassId)
+
+    if not (
+        rotation.GetSrcObjectCount(curve_criteria)
+        or translation.GetSrcObjectCount(curve_criteria)
+    ):
+        layers_list = list()
+
+    elif layers_list is None:
+        layers_list = layers(node.GetScene())
+
+    for layer in layers_list:
 
-        rot_curve = node.LclRotation.GetCurveNode(layer)
-        trn_curve = node.LclTranslation.GetCurveNode(layer)
+        rot_curve = rotation.GetCurveNode(layer)
+        trn_curve = translation.GetCurveNode(layer)
 
         if rot_curve:
             rot_curve.Destroy(True)
@@ -55,17 +83,5 @@ def remove_tr_keys(node, zero=False):
             trn_curve.Destroy(True)
 
     if zero:
-        node.LclRotation.Set(
-            fbx.FbxDouble3(
-                0.0,
-                0.0,
-                0.0,
-            )
-        )
-        node.LclTranslation.Set(
-            fbx.FbxDouble3(
-                0.0,
-                0.0,
-                0.0,
-            )
-        )
+        rotation.Set(_ZERO3)
+        translation.Set(_ZERO3)
@@ -2,11 +2,11 @@ import fbx
 
 
 # ------------------------------------------------------------------------------
-FBX_IMPORT_SETTINGS = [
+FBX_IMPORT_SETTINGS = (
     fbx.EXP_FBX_SHAPE,
     fbx.EXP_FBX_TEXTURE,
     fbx.EXP_FBX_MATERIAL,
     fbx.EXP_FBX_EMBEDDED,
     fbx.EXP_FBX_ANIMATION,
     fbx.EXP_FBX_GLOBAL_SETTINGS,
-]
+)
@@ -4,10 +4,15 @@ to lower the overhead for repetitive tasks.
 """
 import fbx
 
-from . import constants
 from . import manager as _manager
 
 
+# ------------------------------------------------------------------------------
+# -- The ascii writer format index does not change for a given install of the
+# -- fbx sdk, so once resolved we hold onto it.
+_ASCII_FORMAT_INDEX = None
+
+
 # ------------------------------------------------------------------------------
 def load(fbx_path):
     """
@@ -27,13 +32,9 @@ def load(fbx_path):
     # -- we can work with
     fbx_path = fbx_path.replace('\\', '/').strip()
 
-    # -- When we load in an Fbx file we need to define the settings,
-    # -- which we will use the defaults.
-    ios = fbx.FbxIOSettings.Create(
-        fbx_manager,
-        fbx.IOSROOT,
-    )
-    fbx_manager.SetIOSettings(ios)
+    # -- When we load in an Fbx file we need to define the settings. These
+    # -- are only built the first time we load with this manager
+    ios = import_settings(fbx_manager)
 
     # -- Create an empty scene class to which we will load hte
     # -- file into
@@ -48,7 +49,7 @@ def load(fbx_path):
     result = importer.Initialize(
         fbx_path,
         -1,
-        fbx_manager.GetIOSettings(),
+        ios,
     )
 
     # -- If anything went wrong with the initialisation we
@@ -56,11 +57,6 @@ def load(fbx_path):
     if not result:
         return False
 
-    # -- We want to import everything by default!
-    if importer.IsFBX():
-        for setting in constants.FBX_IMPORT_SETTINGS:
-            fbx_manager.GetIOSettings().SetBoolProp(setting, True)
-
     # -- Import the scene and clean up the importer
     # -- instance
     importer.Import(scene)
@@ -69,6 +65,27 @@ def load(fbx_path):
     return scene
 
 
+# --------------------------------------------------------------------------
+def import_settings(fbx_manager=None):
+    """
+    Returns the io settings used when loading files. For the fbxtra manager
+    these are created the first time they are requested and then re-used
+    for all subsequent loads, while any other manager is given a new set.
+
+    :param fbx_manager: The manager to get the settings for. If this is not
+        given then the fbxtra manager is used.
+    :type fbx_manager: fbx.FbxManager
+
+    :return: fbx.FbxIOSettings
+    """
+    # -- The settings for the fbxtra manager are cached alongside
+    # -- it, so they are dropped whenever the manager is reset
+    if fbx_manager is None or fbx_manager is _manager.get():
+        return _manager.import_settings()
+
+    return _manager.build_import_settings(fbx_manager)
+
+
 # --------------------------------------------------------------------------
 def save(scene, fbx_path):
     """
@@ -119,25 +136,28 @@ def ascii_format_index():
     :return: int designator for ascii format
     """
 
-    # -- Get access to teh fbx manager
-    fbx_manager = _manager.get()
+    global _ASCII_FORMAT_INDEX
 
-    # -- We need cycle all the write formats to find the right
-    # -- one.
-    format_count = fbx_manager.GetIOPluginRegistry().GetWriterFormatCount()
+    # -- If we have already resolved the index we can return
+    # -- it straight away
+    if _ASCII_FORMAT_INDEX is not None:
+        return _ASCII_FORMAT_INDEX
 
     # -- Get the fbx registry, this is where we look for
     # -- formats
-    registry = fbx_manager.GetIOPluginRegistry()
+    registry = _manager.get().GetIOPluginRegistry()
+
+    # -- Fall back to the default if all else fails
+    _ASCII_FORMAT_INDEX = -1
 
     # -- Cycle all the formats
-    for idx in range(format_count):
+    for idx in range(registry.GetWriterFormatCount()):
 
         # -- If the format description containts ascii we know
         # -- its safe to use
         if registry.WriterIsFBX(idx):
             if 'ascii' in registry.GetWriterFormatDescription(idx):
-                return idx
+                _ASCII_FORMAT_INDEX = idx
+                break
 
-    # -- Fall back to the default if all else fails
-    return -1
+    return _ASCII_FORMAT_INDEX
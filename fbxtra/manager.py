@@ -1,19 +1,91 @@
-import gc
 import fbx
 
+from . import constants
+
+
+# ------------------------------------------------------------------------------
+# -- This holds the manager instance once we have created it, meaning
+# -- we only ever create a single manager.
+_MANAGER = None
+
+# -- The io settings used for loading, which belong to the manager above
+# -- and are therefore cleared alongside it.
+_IMPORT_SETTINGS = None
+
 
 # ------------------------------------------------------------------------------
 # noinspection PyArgumentList
 def get():
     """
-    Returns the FbxManager. If a manager instance already exists
+    Returns the FbxManager. If fbxtra has already created a manager
     then that instance will be returned otherwise a new manager
     will be generated.
 
     :return: fbx.FbxManager
     """
-    for candidate in gc.get_objects():
-        if isinstance(candidate, fbx.FbxManager):
-            return candidate
+    global _MANAGER
+
+    if _MANAGER is None:
+        _MANAGER = fbx.FbxManager.Create()
+
+    return _MANAGER
+
+
+# ------------------------------------------------------------------------------
+def reset():
+    """
+    Clears the cached FbxManager. This should be called if the manager
+    has been destroyed, so that the next call to get() will resolve
+    a valid manager.
+
+    :return: None
+    """
+    global _MANAGER
+    global _IMPORT_SETTINGS
+
+    _MANAGER = None
+    _IMPORT_SETTINGS = None
+
+
+# ------------------------------------------------------------------------------
+def import_settings():
+    """
+    Returns the io settings used when loading files with the fbxtra
+    manager. These are created the first time they are requested and
+    then re-used until reset() is called.
+
+    :return: fbx.FbxIOSettings
+    """
+    global _IMPORT_SETTINGS
+
+    if _IMPORT_SETTINGS is None:
+        _IMPORT_SETTINGS = build_import_settings(get())
+
+    return _IMPORT_SETTINGS
+
+
+# ------------------------------------------------------------------------------
+def build_import_settings(fbx_manager):
+    """
+    Creates a new set of io settings for the given manager which will
+    import everything, and assigns them to that manager.
+
+    :param fbx_manager: The manager to create the settings for
+    :type fbx_manager: fbx.FbxManager
+
+    :return: fbx.FbxIOSettings
+    """
+    # -- Start from the default settings
+    ios = fbx.FbxIOSettings.Create(
+        fbx_manager,
+        fbx.IOSROOT,
+    )
+
+    # -- We want to import everything by default!
+    set_prop = ios.SetBoolProp
+    for setting in constants.FBX_IMPORT_SETTINGS:
+        set_prop(setting, True)
+
+    fbx_manager.SetIOSettings(ios)
 
-    return fbx.FbxManager.Create()
+    return ios
@@ -22,23 +22,95 @@ def get_children(node, recursive=False):
 
     :return: List of children
     """
-    # -- Define the list to which we will collate
-    # -- all the child nodes we find.
-    children = list()
+    return list(iter_children(node, recursive=recursive))
 
-    for idx in range(node.GetChildCount()):
 
-        # -- Get the child and store it
-        child = node.GetChild(idx)
-        children.append(child)
+# --------------------------------------------------------------------------
+def iter_children(node, recursive=False):
+    """
+    Yields the children of the given node in the same order as
+    get_children, but without building a list. This is useful when you
+    only need to visit each child once or want to stop early.
+
+    Note that the hierarchy should not be altered whilst iterating, use
+    iter_postorder if you need to remove nodes as you go.
+
+    :param node: The node to start searching for children from.
+    :type node: fbx.FbxNode
+
+    :param recursive: If True then the sub-children of each child are
+        also yielded.
+    :type recursive: Bool
+
+    :return: generator(fbx.FbxNode, ...)
+    """
+    # -- Rather than recursing we hold a stack of the nodes still to
+    # -- be visited. Children are pushed in reverse so that they are
+    # -- popped - and therefore yielded - in their natural order, with
+    # -- each child followed by its own sub-children.
+    get_child = node.GetChild
+    stack = [get_child(idx) for idx in reversed(range(node.GetChildCount()))]
+
+    pop = stack.pop
+    push = stack.extend
+
+    while stack:
+
+        # -- Get the child and hand it over
+        child = pop()
+        yield child
 
         # -- If our recursive argument is set as true
-        # -- then we re-call the function
+        # -- then we queue this child's children too
         if recursive:
-            children.extend(get_children(child, recursive=recursive))
+            get_child = child.GetChild
+            push(
+                get_child(idx)
+                for idx in reversed(range(child.GetChildCount()))
+            )
+
+
+# --------------------------------------------------------------------------
+def iter_postorder(node):
+    """
+    Yields all the nodes in the hierarchy of the given node, leaf first,
+    with the given node itself being the last item yielded. Every node is
+    only yielded once all of its children have been, which makes this
+    ideal for deleting a hierarchy from the bottom up.
+
+    Note that the children of each node are resolved before that node is
+    yielded, so it is safe to remove or destroy each node as it is given.
+
+    :param node: The node to start iterating from
+    :type node: fbx.FbxNode
+
+    :return: generator(fbx.FbxNode, ...)
+    """
+    # -- Each entry holds a node along with whether its children
+    # -- have already been queued
+    stack = [(node, False)]
 
-    # -- Return what we have found
-    return children
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        current, expanded = pop()
+
+        # -- All the children of this node have been yielded
+        # -- so it is now safe to give the node itself
+        if expanded:
+            yield current
+            continue
+
+        # -- Re-queue the node to be yielded after its children, which
+        # -- are pushed in reverse so they come out in their natural order
+        push((current, True))
+
+        get_child = current.GetChild
+        stack.extend(
+            (get_child(idx), False)
+            for idx in reversed(range(current.GetChildCount()))
+        )
 
 
 # --------------------------------------------------------------------------
@@ -60,17 +132,47 @@ def get_parent(node, recursive=False):
     # -- Get the immediate parent
     parent = node.GetParent()
 
-    # -- If we have hit the scene root (RootNode), then we return
-    # -- the node as that has no other parent
-    if not parent or parent.GetName() == 'RootNode':
+    # -- Nodes without a parent have nothing above them
+    if not parent:
         return node
 
-    # -- If our recursive argument is True then we keep
-    # -- calling our function until we hit the ceiling.
-    if recursive:
-        parent = get_parent(parent, recursive=recursive)
+    child = node
+
+    while True:
+        grand_parent = parent.GetParent()
+
+        # -- The parent is the top of the hierarchy. If that is the
+        # -- scene root (RootNode), then we return the node below it
+        # -- as the root itself is never returned
+        if not grand_parent:
+            return child if _is_root(parent) else parent
+
+        # -- Unless we're asked to keep walking upward until we
+        # -- hit the ceiling we can stop here
+        if not recursive:
+            return parent
+
+        child, parent = parent, grand_parent
+
+
+# --------------------------------------------------------------------------
+def _is_root(node):
+    """
+    Checks whether the given node is the root node of its scene. This is
+    only needed for nodes which have no parent, so it is kept off the path
+    of a typical step up the hierarchy.
+
+    :param node: The node to test
+    :type node: fbx.FbxNode
+
+    :return: bool
+    """
+    scene = node.GetScene()
 
-    return parent
+    if not scene:
+        return False
+
+    return scene.GetRootNode().GetUniqueID() == node.GetUniqueID()
 
 
 # --------------------------------------------------------------------------
@@ -110,26 +212,26 @@ def set_parent(node, parent, keep_worldspace=True):
     parent.AddChild(node)
 
     # -- We can only set via translate, rotate and scale, so get
-    # -- those out of the matrix, and we want a list of three
-    # -- items
-    translate = [v for v in relative_xfo.GetT()][:3]
-    rotate = [v for v in relative_xfo.GetR()][:3]
-    scale = [v for v in relative_xfo.GetS()][:3]
+    # -- those out of the matrix. Each is a four component vector
+    # -- of which we only want the first three
+    translate = relative_xfo.GetT()
+    rotate = relative_xfo.GetR()
+    scale = relative_xfo.GetS()
 
     node.LclTranslation.Set(
-        fbx.FbxDouble3(*translate),
+        fbx.FbxDouble3(translate[0], translate[1], translate[2]),
     )
     node.LclRotation.Set(
-        fbx.FbxDouble3(*rotate),
+        fbx.FbxDouble3(rotate[0], rotate[1], rotate[2]),
     )
 
     node.LclScaling.Set(
-        fbx.FbxDouble3(*scale),
+        fbx.FbxDouble3(scale[0], scale[1], scale[2]),
     )
 
 
 # --------------------------------------------------------------------------
-def zero(node):
+def zero(node, layers_list=None):
     """
     This will zero the translation and rotation of the given node. Any keys 
         assigned to this nodes translation or rotation will also be removed.
@@ -137,19 +239,12 @@ def zero(node):
     :param node: The node to zero
     :type node: fbx.FbxNode
 
+    :param layers_list: Optional list of the animation layers in the scene,
+        useful when zeroing many nodes from the same scene.
+    :type layers_list: list(fbx.FbxAnimLayer, ...)
+
     :return: None
     """
 
-    # -- Remove keys first
-    _animation.remove_tr_keys(node)
-
-    # -- Define the zero vector which we will apply to the node
-    zero_vector = fbx.FbxDouble3(
-        0.0,
-        0.0,
-        0.0,
-    )
-
-    # -- Apply the zero'ing
-    node.LclTranslation.Set(zero_vector)
-    node.LclRotation.Set(zero_vector)
+    # -- Remove the keys and apply the zero'ing
+    _animation.remove_tr_keys(node, zero=True, layers_list=layers_list)
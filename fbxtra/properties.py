@@ -2,19 +2,9 @@ import fbx
 
 
 # ------------------------------------------------------------------------------
-def get_value(fbx_property):
-    """
-    Get the value of a property, which requires casting.
-
-    This code is taken from :
-    https://gist.github.com/Meatplowz/8f408912cf554f2d11085fb68b62d3a3
-
-    :param fbx_property: The property to request the value from
-    :type fbx_property: fbx.FbxProperty
-
-    :return: variable
-    """
-    unsupported_types = [
+# -- Property types which we do not support or have not mapped yet
+_UNSUPPORTED_TYPES = frozenset(
+    [
         fbx.eFbxUndefined,
         fbx.eFbxChar,
         fbx.eFbxUChar,
@@ -32,39 +22,43 @@ def get_value(fbx_property):
         fbx.eFbxDateTime,
         fbx.eFbxTypeCount,
     ]
+)
 
-    # property is not supported or mapped yet
-    casted_property = None
-    property_type = fbx_property.GetPropertyDataType().GetType()
-
-    if property_type in unsupported_types:
-        return None
-
-    if property_type == fbx.eFbxBool:
-        casted_property = fbx.FbxPropertyBool1(fbx_property)
+# -- The property class to cast to for each supported property type
+_CASTERS = {
+    fbx.eFbxBool: fbx.FbxPropertyBool1,
+    fbx.eFbxDouble: fbx.FbxPropertyDouble1,
+    fbx.eFbxDouble2: fbx.FbxPropertyDouble2,
+    fbx.eFbxDouble3: fbx.FbxPropertyDouble3,
+    fbx.eFbxDouble4: fbx.FbxPropertyDouble4,
+    fbx.eFbxInt: fbx.FbxPropertyInteger1,
+    fbx.eFbxFloat: fbx.FbxPropertyFloat1,
+    fbx.eFbxString: fbx.FbxPropertyString,
+}
 
-    elif property_type == fbx.eFbxDouble:
-        casted_property = fbx.FbxPropertyDouble1(fbx_property)
 
-    elif property_type == fbx.eFbxDouble2:
-        casted_property = fbx.FbxPropertyDouble2(fbx_property)
+# ------------------------------------------------------------------------------
+def get_value(fbx_property):
+    """
+    Get the value of a property, which requires casting.
 
-    elif property_type == fbx.eFbxDouble3:
-        casted_property = fbx.FbxPropertyDouble3(fbx_property)
+    This code is taken from :
+    https://gist.github.com/Meatplowz/8f408912cf554f2d11085fb68b62d3a3
 
-    elif property_type == fbx.eFbxDouble4:
-        casted_property = fbx.FbxPropertyDouble4(fbx_property)
+    :param fbx_property: The property to request the value from
+    :type fbx_property: fbx.FbxProperty
 
-    elif property_type == fbx.eFbxInt:
-        casted_property = fbx.FbxPropertyInteger1(fbx_property)
+    :return: variable
+    """
+    property_type = fbx_property.GetPropertyDataType().GetType()
 
-    elif property_type == fbx.eFbxFloat:
-        casted_property = fbx.FbxPropertyFloat1(fbx_property)
+    # property is not supported or mapped yet
+    if property_type in _UNSUPPORTED_TYPES:
+        return None
 
-    elif property_type == fbx.eFbxString:
-        casted_property = fbx.FbxPropertyString(fbx_property)
+    caster = _CASTERS.get(property_type)
 
-    else:
+    if caster is None:
         raise ValueError(
             'Unknown property type: {0} {1}'.format(
                 fbx_property.GetPropertyDataType().GetName(),
@@ -72,7 +66,27 @@ def get_value(fbx_property):
             ),
         )
 
-    return casted_property.Get()
+    return caster(fbx_property).Get()
+
+
+# ------------------------------------------------------------------------------
+def _iter_properties(node):
+    """
+    Yields each property on the given node in turn. Being a generator,
+    callers which only want the first match can stop early without
+    walking the remaining properties.
+
+    :param node: Node to iterate the properties of
+    :type node: fbx.FbxObject
+
+    :return: generator(fbx.FbxProperty, ...)
+    """
+    get_next = node.GetNextProperty
+
+    prop = node.GetFirstProperty()
+    while prop.IsValid():
+        yield prop
+        prop = get_next(prop)
 
 
 # ------------------------------------------------------------------------------
@@ -88,17 +102,14 @@ def find(node, property_name):
 
     :return: fbx.FbxProperty or None
     """
-    matched = None
-    prop = node.GetFirstProperty()
-    while prop.IsValid():
-
-        if prop.GetName() == property_name:
-            matched = prop
-            break
-
-        prop = node.GetNextProperty(prop)
-
-    return matched
+    return next(
+        (
+            prop
+            for prop in _iter_properties(node)
+            if prop.GetName() == property_name
+        ),
+        None,
+    )
 
 
 # ------------------------------------------------------------------------------
@@ -111,14 +122,7 @@ def get_all(node):
 
     :return: list(fbx.FbxProperty, ...)
     """
-
-    results = list()
-    prop = node.GetFirstProperty()
-    while prop.IsValid():
-        results.append(prop)
-        prop = node.GetNextProperty(prop)
-
-    return results
+    return list(_iter_properties(node))
 
 
 # ------------------------------------------------------------------------------
@@ -133,13 +137,8 @@ def all_of_type(node, property_type):
 
     :return: list(FbxProperty, FbxProperty, ...)
     """
-    results = list()
-    prop = node.GetFirstProperty()
-    while prop.IsValid():
-
-        if prop.GetPropertyDataType() == property_type:
-            results.append(prop)
-
-        prop = node.GetNextProperty(prop)
-
-    return results
+    return [
+        prop
+        for prop in _iter_properties(node)
+        if prop.GetPropertyDataType() == property_type
+    ]
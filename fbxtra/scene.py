@@ -6,6 +6,16 @@ import fbx
 from . import node as _node
 
 
+# --------------------------------------------------------------------------
+# -- The name lookup for the most recently scanned scene, keyed by the unique
+# -- id of that scene. Only one scene is ever held, so lookups for scenes
+# -- which have since been destroyed are never kept around. The lookup maps
+# -- an object name to the index of that object within the scene's root
+# -- property and its unique id. We deliberately do not hold the objects
+# -- themselves, as they may have been destroyed since.
+_SCENE_CACHE = dict()
+
+
 # --------------------------------------------------------------------------
 def get(scene, name):
     """
@@ -20,67 +30,231 @@ def get(scene, name):
 
     :return: fbx.FbxObject
     """
-    for fbx_object in get_all(scene):
-        if fbx_object.GetName() == name:
-            return fbx_object
+    return get_many(scene, [name])[0]
+
+
+# --------------------------------------------------------------------------
+def get_many(scene, names):
+    """
+    Gives access to the fbx.FbxObject's with the given names. This only
+    walks the scene once, regardless of how many names are given, making
+    it much cheaper than calling get() for each name.
+
+    :param scene: The fbx.FbxScene to search within
+    :type scene: fbx.FbxScene
+
+    :param names: The names of the fbx objects you want to get. This may
+        be any iterable of names.
+    :type names: list(str, ...)
+
+    :return: list(fbx.FbxObject, ...) in the same order as the given names,
+        with None for any name which could not be found.
+    """
+    # -- We may need to resolve the names twice, so take a copy in
+    # -- case we have been given something we can only iterate once
+    names = list(names)
+
+    by_name, fresh = _scan(scene)
+    matched = _resolve(scene, by_name, names)
+
+    # -- If the lookup was only just built then it is already
+    # -- up to date, so anything missing really does not exist
+    if fresh or all(matched):
+        return matched
+
+    # -- Something was not found or has changed since the lookup was
+    # -- built, so rebuild the lookup once and resolve against that
+    by_name, _ = _scan(scene, rebuild=True)
+    return _resolve(scene, by_name, names)
+
+
+# --------------------------------------------------------------------------
+def _resolve(scene, by_name, names):
+    """
+    Resolves each of the given names against the given lookup. Every object
+    is taken live from the scene and is only given back if it still has
+    the unique id and name it had when the lookup was built.
+
+    :param scene: The scene the lookup was built from
+    :type scene: fbx.FbxScene
+
+    :param by_name: The lookup as given by _scan
+    :type by_name: dict(str: tuple(int, int))
+
+    :param names: The names of the fbx objects you want to get
+    :type names: list(str, ...)
+
+    :return: list(fbx.FbxObject, ...) with None for any name which could
+        not be resolved.
+    """
+    get_object = scene.RootProperty.GetSrcObject
+
+    matched = list()
+
+    for name in names:
+        entry = by_name.get(name)
+        fbx_object = get_object(entry[0]) if entry else None
+
+        # -- The scene may have been altered outside of fbxtra, in
+        # -- which case the object at this index may not be ours
+        if fbx_object and (
+            fbx_object.GetUniqueID() != entry[1]
+            or fbx_object.GetName() != name
+        ):
+            fbx_object = None
+
+        matched.append(fbx_object)
+
+    return matched
+
+
+# --------------------------------------------------------------------------
+def _scan(scene, rebuild=False):
+    """
+    Walks all the objects in the scene once, building a lookup of the index
+    and unique id of each object keyed by its name. This is built the first
+    time it is requested and then re-used until fbxtra alters the scene or
+    a rebuild is explicitly asked for.
+
+    :param scene: The scene to get the lookup for
+    :type scene: fbx.FbxScene
+
+    :param rebuild: If True the lookup will be rebuilt regardless of
+        whether it already exists.
+    :type rebuild: bool
+
+    :return: tuple(dict(str: tuple(int, int)), bool) where the bool is
+        True if the lookup was built by this call.
+    """
+    key = scene.GetUniqueID()
+
+    by_name = _SCENE_CACHE.get(key)
+
+    if not rebuild and by_name is not None:
+        return by_name, False
 
-    return None
+    # -- Walk the scene building the lookup from scratch
+    by_name = dict()
 
+    root_property = scene.RootProperty
+    get_object = root_property.GetSrcObject
+
+    for idx in range(root_property.GetSrcObjectCount()):
+        fbx_object = get_object(idx)
+
+        # -- Where names clash the first object in the scene wins
+        if fbx_object:
+            by_name.setdefault(
+                fbx_object.GetName(),
+                (idx, fbx_object.GetUniqueID()),
+            )
+
+    # -- Drop the lookup of any other scene before storing this one
+    _SCENE_CACHE.clear()
+    _SCENE_CACHE[key] = by_name
+
+    return by_name, True
+
+
+# --------------------------------------------------------------------------
+def _invalidate(scene):
+    """
+    Discards any cached lookups for the given scene. This should be called
+    whenever fbxtra adds, removes or renames objects within a scene.
+
+    :param scene: The scene to discard the lookups for
+    :type scene: fbx.FbxScene
+
+    :return: None
+    """
+    _SCENE_CACHE.pop(scene.GetUniqueID(), None)
 
 
 # --------------------------------------------------------------------------
-def get_all(scene):
+def get_all(scene, types=None):
     """
     Returns all the objects within the FbxScene.
     
     :param scene: The scene to get a list of objects from
     :type scene: fbx.FbxScene
 
+    :param types: Optional. A list of type names. If given then only
+        objects whose type name is in this list will be returned, meaning
+        an empty list will return no objects.
+    :type types: list(str, ...)
+
     :return: list of fbx.FbxObject 
     """
-    objects = []
-    object_count = scene.RootProperty.GetSrcObjectCount()
+    return list(iter_all(scene, types=types))
 
-    # -- Loop through the root property and get the node for each index
-    for idx in range(object_count):
-        fbx_object = scene.RootProperty.GetSrcObject(idx)
 
-        if fbx_object:
-            objects.append(fbx_object)
+# --------------------------------------------------------------------------
+def iter_all(scene, types=None):
+    """
+    Yields all the objects within the FbxScene one at a time rather than
+    building a list, which is useful when you only need to visit each
+    object once or want to stop as soon as you find what you need.
 
-    return objects
+    :param scene: The scene to iterate the objects of
+    :type scene: fbx.FbxScene
+
+    :param types: Optional. A list of type names. If given then only
+        objects whose type name is in this list will be yielded.
+    :type types: list(str, ...)
+
+    :return: generator(fbx.FbxObject, ...)
+    """
+    # -- Resolve the root property and its accessor once
+    # -- rather than per object
+    root_property = scene.RootProperty
+    get_object = root_property.GetSrcObject
+
+    # -- Test the type of each object as we go, so we only
+    # -- need the one pass over the scene
+    if types is not None:
+        types = frozenset(types)
+
+    for idx in range(root_property.GetSrcObjectCount()):
+        fbx_object = get_object(idx)
+
+        if not fbx_object:
+            continue
+
+        if types is None or fbx_object.GetTypeName() in types:
+            yield fbx_object
 
 
 # --------------------------------------------------------------------------
-def of_type(scene, required_type):
+def iter_of_type(scene, required_type):
     """
-    Returns all the nodes of the given type.
+    Yields all the nodes of the given type one at a time rather than
+    building a list.
 
     :param scene: The scene which the search should occur
     :type scene: fbx.FbxScene
 
-    :param node_type: The type name to search for
-    :type node_type: str
+    :param required_type: The type name to search for
+    :type required_type: str
 
-    :return: List of nodes of the given type
+    :return: generator(fbx.FbxObject, ...)
     """
-    # -- Define a list to add all our matches
-    # -- to
-    matched = list()
+    return iter_all(scene, types=(required_type,))
 
-    # -- Get a list of all the objects in the scene
-    object_count = scene.RootProperty.GetSrcObjectCount()
 
-    for idx in range(object_count):
-        node = scene.RootProperty.GetSrcObject(idx)
+# --------------------------------------------------------------------------
+def of_type(scene, required_type):
+    """
+    Returns all the nodes of the given type.
+
+    :param scene: The scene which the search should occur
+    :type scene: fbx.FbxScene
 
-        # -- If the node is valid, and the type matches
-        # -- the required type then we scoop it
-        if node and node.GetTypeName() == required_type:
-            matched.append(node)
+    :param required_type: The type name to search for
+    :type required_type: str
 
-    # -- Return all the matches
-    return matched
+    :return: List of nodes of the given type
+    """
+    return list(iter_of_type(scene, required_type))
 
 
 # --------------------------------------------------------------------------
@@ -100,6 +274,47 @@ def children(scene, recursive=False):
     return _node.get_children(scene.GetRootNode(), recursive=recursive)
 
 
+# --------------------------------------------------------------------------
+def iter_children(scene, recursive=False):
+    """
+    Yields the children in the scene in the same order as children(),
+    but without building a list.
+
+    :param scene: The scene to look within for the child nodes
+    :type scene: fbx.FbxScene
+
+    :param recursive: If True then all the children and their
+        sub-children will be yielded. If False then only the
+        scenes top level children will be yielded.
+
+    :return: generator(fbx.FbxNode, ...)
+    """
+    return _node.iter_children(scene.GetRootNode(), recursive=recursive)
+
+
+# --------------------------------------------------------------------------
+def rename(fbx_object, name):
+    """
+    Renames the given object. Renaming through this function rather than
+    calling SetName directly keeps fbxtra's cached scene lookups in step
+    with the change.
+
+    :param fbx_object: The object to rename
+    :type fbx_object: fbx.FbxObject
+
+    :param name: The new name to give the object
+    :type name: str
+
+    :return: None
+    """
+    fbx_object.SetName(name)
+
+    scene = fbx_object.GetScene()
+
+    if scene:
+        _invalidate(scene)
+
+
 # --------------------------------------------------------------------------
 def clear_namespaces(scene, nodes=None):
     """
@@ -119,16 +334,24 @@ def clear_namespaces(scene, nodes=None):
     # -- of all the nodes in the scene
     nodes = nodes or get_all(scene)
 
+    renamed = False
+
     # -- Cycle over all our nodes
     for node in nodes:
 
         # -- Extract the name of the node so we can inspect it
         node_name = node.GetName()
-        name_parts = node_name.split(':')
 
-        # -- If we have more than one part then the node has a namespace
-        # -- so we should remove it
-        node.SetName(name_parts[-1])
+        # -- If the name contains a separator then the node has a
+        # -- namespace, so we should remove it. Nodes without one are
+        # -- left untouched.
+        if ':' in node_name:
+            node.SetName(node_name.rpartition(':')[2])
+            renamed = True
+
+    # -- If names have changed then any lookups are now out of date
+    if renamed:
+        _invalidate(scene)
 
 
 # --------------------------------------------------------------------------
@@ -147,43 +370,59 @@ def clear(scene, excluding=None):
 
     :return: None
     """
+    # -- If we have not been given anything to exclude then
+    # -- every top level node is removed
+    excluding = excluding or list()
+
+    # -- Split the exclusions into the objects we have been given
+    # -- directly and the names we need to resolve
+    excluded_objects = list()
+    names_to_resolve = list()
+
+    for item in excluding:
+        if isinstance(item, fbx.FbxObject):
+            excluded_objects.append(item)
+
+        else:
+            names_to_resolve.append(item)
+
+    # -- Resolve all the names in a single pass rather than searching
+    # -- the scene for each one, ignoring any which do not exist
+    if names_to_resolve:
+        excluded_objects.extend(
+            fbx_object
+            for fbx_object in get_many(scene, names_to_resolve)
+            if fbx_object
+        )
 
     # -- Start by moving any nodes which we want to exclude from the
     # -- clearing process to the scene root
-    for idx, node, in enumerate(excluding):
-
-        # -- Ensure we're working with Fbx objects
-        if not isinstance(node, fbx.FbxObject):
-            node = get(scene, node)
-            excluding[idx] = node
-
-        # -- Move the item to the scene root
-        _node.set_parent(excluding[idx], None)
+    for fbx_object in excluded_objects:
+        _node.set_parent(fbx_object, None)
 
-        # -- From this point on we're going to deal with names
-        # -- so lets switch to that
-        excluding[idx] = node.GetName()
+    # -- From this point on we're going to deal with names, which
+    # -- we hold in a set for quick membership tests
+    excluded_names = set(
+        fbx_object.GetName()
+        for fbx_object in excluded_objects
+    )
 
-    # -- We now need to cycle over all the root nodes
-    # -- in the scene
-    for top_level_node in children(scene, recursive=False)[:]:
+    # -- We now need to cycle over all the root nodes in the scene. We
+    # -- are always given a new list, so it is safe to remove nodes from
+    # -- the scene whilst iterating it
+    for top_level_node in children(scene, recursive=False):
 
         # -- if root node in preserve list then we need to delete it
-        if top_level_node.GetName() in excluding:
+        if top_level_node.GetName() in excluded_names:
             continue
 
-        # -- Find all the nodes under the current child which
-        # -- we need to remove, then reverse the order so we're
-        # -- deleting from the leaf level up
-        all_child_nodes = _node.get_children(top_level_node, recursive=True)
-        all_child_nodes.reverse()
-
-        # -- As well as the children we need to make
-        # -- sure we remove this root node too
-        all_child_nodes.append(top_level_node)
-
-        for node_to_remove in all_child_nodes:
+        # -- Walk all the nodes under the current child, including
+        # -- the child itself, from the leaf level up
+        for node_to_remove in _node.iter_postorder(top_level_node):
             # -- Remove the node and then ask for it to be
             # -- destroyed.
             scene.RemoveNode(node_to_remove)
             node_to_remove.Destroy()
+
+    # -- Objects have been removed, so any lookups are now out of date
+    _invalidate(scene)